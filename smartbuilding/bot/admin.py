@@ -1,3 +1,22 @@
 from django.contrib import admin
 
-# Register your models here.
+from .models import MaintenanceTicket, Technician
+
+
+@admin.register(Technician)
+class TechnicianAdmin(admin.ModelAdmin):
+	list_display = ('name', 'facility', 'contact_number', 'is_active', 'active_tickets', 'max_active_tickets')
+	list_filter = ('facility', 'is_active')
+	search_fields = ('name', 'contact_number')
+	# Kept by bot.dispatch as tickets are assigned and resolved
+	readonly_fields = ('active_tickets',)
+
+
+@admin.register(MaintenanceTicket)
+class MaintenanceTicketAdmin(admin.ModelAdmin):
+	list_display = ('pk', 'facility', 'flat_no', 'issue', 'priority', 'status', 'assigned_to', 'reported_at')
+	list_filter = ('facility', 'status', 'priority')
+	search_fields = ('flat_no', 'issue')
+	# Assignment goes through dispatch_tickets / resolve_ticket so technician
+	# loads stay right; the admin only shows it.
+	readonly_fields = ('status', 'assigned_to', 'reported_at', 'assigned_at', 'resolved_at')
@@ -0,0 +1,220 @@
+"""Versioned read-only JSON API used by the mobile client.
+
+Every resource is served as compact JSON and supports:
+
+- `?fields=a,b` to return only the listed fields (sparse field selection)
+- `?limit=N&after=<cursor>` keyset pagination on collections
+- gzip when the client sends `Accept-Encoding: gzip`
+- strong ETags derived from the resource's data version, so a client
+  revalidating with `If-None-Match` gets a 304 without the payload being
+  rebuilt or re-sent.
+"""
+import hashlib
+import json
+import re
+import time
+from bisect import bisect_right
+
+from django.http import JsonResponse
+from django.utils.cache import get_conditional_response, patch_cache_control, patch_vary_headers
+from django.utils.http import quote_etag
+from django.utils.text import compress_string
+from django.views.decorators.http import require_safe
+
+from . import data
+from .models import Signup
+
+API_VERSION = 'v1'
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+# Bodies smaller than this are not worth the gzip header overhead
+GZIP_MIN_LENGTH = 200
+
+_accepts_gzip = re.compile(r'\bgzip\b').search
+
+# Same compact encoding for every body, errors included
+JSON_PARAMS = {'separators': (',', ':'), 'ensure_ascii': False}
+# Seconds a session's account check is trusted before the Signup row is
+# looked up again
+ACCOUNT_CHECK_TTL = 60
+
+
+def _version(payload):
+	"""Return a short content hash identifying this version of `payload`."""
+	raw = json.dumps(payload, sort_keys=True, ensure_ascii=False).encode('utf-8')
+	return hashlib.sha256(raw).hexdigest()[:16]
+
+
+class Collection:
+	"""A list of records served in `key` order with keyset pagination."""
+
+	def __init__(self, rows, key):
+		self.key = key
+		self.rows = sorted(rows, key=lambda row: row[key])
+		self.keys = [row[key] for row in self.rows]
+		self.fields = {name for row in self.rows for name in row}
+		self.version = _version(self.rows)
+
+	def cursor(self, after):
+		"""Convert an `after` query value to a key, or raise ValueError."""
+		# Cursors are the key of the last row the client saw; ints are
+		# compared as ints so page boundaries follow the sort order.
+		if self.keys and isinstance(self.keys[0], int):
+			return int(after)
+		return after
+
+	def render(self, fields, limit, after):
+		start = 0
+		if after is not None:
+			start = bisect_right(self.keys, after)
+		page = self.rows[start:start + limit]
+		has_more = start + limit < len(self.rows)
+		return {
+			'results': [_select(row, fields) for row in page],
+			'next': str(page[-1][self.key]) if page and has_more else None,
+		}
+
+
+class Document:
+	"""A single record; only field selection applies."""
+
+	def __init__(self, payload):
+		self.payload = payload
+		self.fields = set(payload)
+		self.version = _version(payload)
+
+	def cursor(self, after):
+		return None
+
+	def render(self, fields, limit, after):
+		return _select(self.payload, fields)
+
+
+def _select(record, fields):
+	if fields is None:
+		return record
+	return {name: record[name] for name in fields if name in record}
+
+
+RESOURCES = {
+	'directory': Collection(data.APARTMENTS, 'flat_no'),
+	# Festivals have no natural key, so number them in calendar order
+	'events': Collection([dict(event, id=i) for i, event in enumerate(data.EVENTS, 1)], 'id'),
+	'parking': Document({
+		'rules': data.PARKING_RULES,
+		'locations': data.PARKING_LOCATIONS,
+		'ev_chargers': data.EV_CHARGERS,
+	}),
+	'gym': Document(dict(data.GYM, members=data.GYM_MEMBERS)),
+	'facilities': Collection(data.FACILITIES, 'slug'),
+}
+
+FACILITY_RESOURCES = {
+	'water-tank': Document(data.WATER_TANK_DEFAULTS),
+	'electricity': Collection(data.ELECTRICITY_RECORDS, 'flat_no'),
+	'gas-line': Collection(data.GAS_RECORDS, 'flat_no'),
+	'wifi': Collection(data.WIFI_RECORDS, 'flat_no'),
+	'plumbing': Collection(data.PLUMBING_RECORDS, 'flat_no'),
+	'sewage-treatment': Collection(data.SEWAGE_RECORDS, 'plant'),
+}
+
+
+def _error(message, status):
+	return JsonResponse({'error': message}, status=status, json_dumps_params=JSON_PARAMS)
+
+
+def _parse_query(request, resource):
+	"""Return (fields, limit, after) from the query string or raise ValueError."""
+	fields = None
+	if request.GET.get('fields'):
+		fields = [name.strip() for name in request.GET['fields'].split(',') if name.strip()]
+		if not fields:
+			raise ValueError("`fields` must name at least one field.")
+		unknown = sorted(set(fields) - resource.fields)
+		if unknown:
+			raise ValueError(f"Unknown fields: {', '.join(unknown)}.")
+
+	limit = request.GET.get('limit', DEFAULT_PAGE_SIZE)
+	try:
+		limit = int(limit)
+	except (TypeError, ValueError):
+		raise ValueError("`limit` must be an integer.")
+	if not 1 <= limit <= MAX_PAGE_SIZE:
+		raise ValueError(f"`limit` must be between 1 and {MAX_PAGE_SIZE}.")
+
+	after = request.GET.get('after')
+	if after is not None:
+		try:
+			after = resource.cursor(after)
+		except ValueError:
+			raise ValueError("Invalid `after` cursor.")
+
+	return fields, limit, after
+
+
+def _has_account(request):
+	"""Whether the session belongs to an account that still exists.
+
+	Like the dashboard pages, a session outliving a deleted account must not
+	keep API access. A successful check is remembered in the session for
+	ACCOUNT_CHECK_TTL seconds, so a client revalidating in a loop is served
+	from the cached session alone.
+	"""
+	user_id = request.session.get('user_id')
+	if not user_id:
+		return False
+	checked = request.session.get('api_account_checked')
+	if checked and checked[0] == user_id and time.time() - checked[1] < ACCOUNT_CHECK_TTL:
+		return True
+	if not Signup.objects.filter(id=user_id).exists():
+		return False
+	request.session['api_account_checked'] = [user_id, time.time()]
+	return True
+
+
+def _serve(request, resource):
+	"""Answer a GET/HEAD for `resource`, short-circuiting to 304 when possible."""
+	if not _has_account(request):
+		return _error("Authentication required.", 401)
+
+	try:
+		fields, limit, after = _parse_query(request, resource)
+	except ValueError as exc:
+		return _error(str(exc), 400)
+
+	# The gzip and identity bodies are different representations, so each
+	# gets its own strong validator.
+	gzip = bool(_accepts_gzip(request.META.get('HTTP_ACCEPT_ENCODING', '')))
+	query = '&'.join(f'{k}={v}' for k, v in sorted(request.GET.items()))
+	tag = hashlib.sha256(
+		f"{API_VERSION}:{resource.version}:{request.path}:{query}:{gzip}".encode('utf-8')
+	).hexdigest()[:32]
+	etag = quote_etag(tag)
+
+	response = get_conditional_response(request, etag=etag)
+	if response is None:
+		response = JsonResponse(resource.render(fields, limit, after), json_dumps_params=JSON_PARAMS)
+		if gzip and len(response.content) >= GZIP_MIN_LENGTH:
+			response.content = compress_string(response.content)
+			response['Content-Encoding'] = 'gzip'
+
+	response['ETag'] = etag
+	patch_vary_headers(response, ('Accept-Encoding',))
+	patch_cache_control(response, private=True, no_cache=True)
+	return response
+
+
+@require_safe
+def resource_view(request, resource):
+	"""Serve one of the top-level resources in `RESOURCES`."""
+	if resource not in RESOURCES:
+		return _error("Not found.", 404)
+	return _serve(request, RESOURCES[resource])
+
+
+@require_safe
+def facility_view(request, facility):
+	"""Serve the records for a single facility (slug)."""
+	if facility not in FACILITY_RESOURCES:
+		return _error("Not found.", 404)
+	return _serve(request, FACILITY_RESOURCES[facility])
@@ -0,0 +1,215 @@
+"""Sample society data shared by the dashboard pages and the JSON API.
+
+The HTML views and `bot.api` both read from here so the two never drift apart.
+"""
+
+# Facility slug -> display name
+FACILITY_NAMES = {
+	'water-tank': 'Water tank capacity',
+	'electricity': 'Electricity',
+	'gas-line': 'Gas line',
+	'wifi': 'WiFi',
+	'plumbing': 'Plumbing',
+	'sewage-treatment': 'Sewage treatment',
+}
+
+# Facilities index; slugs link to the individual facility pages
+FACILITIES = [
+	{"name": "Water tank capacity", "slug": "water-tank"},
+	{"name": "Electricity", "slug": "electricity"},
+	{"name": "Gas line", "slug": "gas-line"},
+	{"name": "WiFi", "slug": "wifi"},
+	{"name": "Plumbing", "slug": "plumbing"},
+	{"name": "Sewage treatment", "slug": "sewage-treatment"},
+]
+
+# Contact quick numbers
+CONTACTS = [
+	{'name': 'Fire brigade', 'numbers': ['101', '+91-11-23456789']},
+	{'name': 'Gas connection', 'numbers': ['1906', '+91-22-12345678']},
+	{'name': 'Electricity (faults)', 'numbers': ['1912', '+91-22-87654321']},
+	{'name': 'WiFi support', 'numbers': ['1800-123-WIFI', '+91-999000111']},
+	{'name': 'Lift service', 'numbers': ['1800-234-LIFT', '+91-888777666']},
+	{'name': 'Cleaning', 'numbers': ['+91-700000001']},
+	{'name': 'Police (station)', 'numbers': ['100', '+91-11-922222222']},
+	{'name': 'Ambulance', 'numbers': ['102', '+91-11-933333333']},
+	{'name': 'Plumbing', 'numbers': ['+91-700000002']},
+	{'name': 'Security', 'numbers': ['+91-700000003']},
+]
+
+# Events list (Indian festivals with ideas)
+EVENTS = [
+	{"month": "January", "festival": "Makar Sankranti / Pongal / Lohri", "ideas": "Kite flying, traditional sweets sharing"},
+	{"month": "March", "festival": "Holi", "ideas": "Organic color celebration, music, sweets"},
+	{"month": "March–April", "festival": "Ram Navami / Easter", "ideas": "Cultural prayers, kids’ activities"},
+	{"month": "April", "festival": "Gudi Padwa / Ugadi / Baisakhi / Tamil New Year", "ideas": "Traditional dress, decoration, potluck"},
+	{"month": "August", "festival": "Raksha Bandhan", "ideas": "Rakhi tying ceremony for kids & elders"},
+	{"month": "August", "festival": "Independence Day (15 Aug)", "ideas": "Flag hoisting, patriotic songs, games"},
+	{"month": "August–September", "festival": "Janmashtami", "ideas": "Dahi handi, fancy dress (Krishna/Radha)"},
+	{"month": "September", "festival": "Ganesh Chaturthi", "ideas": "Idol installation, cultural nights, visarjan"},
+	{"month": "October", "festival": "Navratri / Dussehra / Durga Puja", "ideas": "Garba nights, rangoli, pooja, drama"},
+	{"month": "October–November", "festival": "Diwali", "ideas": "Diyas lighting, sweets exchange, decoration contest"},
+	{"month": "December", "festival": "Christmas", "ideas": "Secret Santa, decoration, carol singing"},
+]
+
+# Info page details
+INFO = {
+	'society_name': 'Sunshine Residency Co-operative Housing Society',
+	'address': 'Plot No. 12, Green Park Road, Wakad, Pune – 411057',
+	'registration_no': 'MH/PUNE/CHS/2020/214',
+	'total_flats': '80',
+	'buildings': 'A, B, C, D',
+	'secretary': 'Mr. Rajesh Nair',
+	'treasurer': 'Mrs. Priya Patil',
+	'chairman': 'Mr. Sanjay Deshmukh',
+	'maintenance_due': '10th of every month',
+}
+
+# Parking details and rules
+PARKING_RULES = [
+	"Each flat is allotted one car and one bike parking slot.",
+	"Visitors must park only in designated visitor slots (V1–V10).",
+	"Overnight visitor parking requires security approval.",
+	"No commercial or outsider parking allowed.",
+	"EV charging is allowed only at marked EV slots.",
+	"Parking stickers must be displayed on all vehicles.",
+	"Any illegal or double parking will attract a fine of ₹500.",
+]
+
+PARKING_LOCATIONS = [
+	{"location": "Basement-1", "capacity": "25 Slots", "type": "4-Wheeler", "cctv": "Yes", "lighting": "LED", "remarks": "Reserved for flat owners"},
+	{"location": "Basement-2", "capacity": "15 Slots", "type": "4-Wheeler", "cctv": "Yes", "lighting": "LED", "remarks": "Includes EV charging"},
+	{"location": "Ground Level", "capacity": "20 Slots", "type": "2-Wheeler & Visitors", "cctv": "Yes", "lighting": "Solar", "remarks": "Open access for guests"},
+	{"location": "Open Area (Rear)", "capacity": "10 Slots", "type": "Visitor Parking", "cctv": "Partial", "lighting": "Normal", "remarks": "Used during festivals"},
+]
+
+EV_CHARGERS = [
+	{"point_id": "EV-01", "slot_no": "EV1", "charger_type": "7.2kW Type 2", "status": "Working", "contact": "Society Electrician (Sunil More)"},
+	{"point_id": "EV-02", "slot_no": "EV2", "charger_type": "Fast DC 15kW", "status": "Under Maintenance", "contact": "Vendor – GreenCharge Pvt. Ltd."},
+]
+
+# Apartment directory
+APARTMENTS = [
+	{"flat_no": "A-101", "name": "Rajesh Nair", "role": "Chairman", "contact": "9876543210", "email": "rajesh.nair@example.com", "members": 4, "vehicle": "MH12AB1234"},
+	{"flat_no": "A-202", "name": "Priya Patil", "role": "Treasurer", "contact": "9865321478", "email": "priya.patil@example.com", "members": 3, "vehicle": "MH12CD5678"},
+	{"flat_no": "B-303", "name": "Anil Joshi", "role": "Owner", "contact": "9823456712", "email": "anil.joshi@example.com", "members": 5, "vehicle": "MH12EF8910"},
+	{"flat_no": "C-102", "name": "Sneha Kulkarni", "role": "Tenant", "contact": "9897654321", "email": "sneha.kulkarni@example.com", "members": 2, "vehicle": "MH12GH2345"},
+	{"flat_no": "D-401", "name": "Rohit Sharma", "role": "Owner", "contact": "9776543211", "email": "rohit.sharma@example.com", "members": 3, "vehicle": "MH12IJ8765"},
+	{"flat_no": "B-201", "name": "Meena Gupta", "role": "Secretary", "contact": "9812345678", "email": "meena.gupta@example.com", "members": 4, "vehicle": "MH12KL4321"},
+	{"flat_no": "A-303", "name": "Vishal Deshmukh", "role": "Owner", "contact": "9856743210", "email": "vishal.deshmukh@example.com", "members": 3, "vehicle": "MH12MN6789"},
+	{"flat_no": "C-204", "name": "Kavita Singh", "role": "Tenant", "contact": "9845123987", "email": "kavita.singh@example.com", "members": 2, "vehicle": "MH12OP4567"},
+	{"flat_no": "D-101", "name": "Suresh Menon", "role": "Owner", "contact": "9834678910", "email": "suresh.menon@example.com", "members": 5, "vehicle": "MH12QR7891"},
+	{"flat_no": "B-402", "name": "Alka Verma", "role": "Tenant", "contact": "9801234567", "email": "alka.verma@example.com", "members": 3, "vehicle": "MH12ST2348"},
+	{"flat_no": "E-303", "name": "Deepak Jadhav", "role": "Owner", "contact": "9822198765", "email": "deepak.jadhav@example.com", "members": 4, "vehicle": "MH12UV6754"},
+	{"flat_no": "E-102", "name": "Reema Bhattacharjee", "role": "Owner", "contact": "9819988776", "email": "reema.bhatt@example.com", "members": 3, "vehicle": "MH12WX0987"},
+	{"flat_no": "A-104", "name": "Tushar Mehta", "role": "Tenant", "contact": "9871234569", "email": "tushar.mehta@example.com", "members": 2, "vehicle": "MH12YZ5643"},
+	{"flat_no": "C-305", "name": "Neha Bansal", "role": "Owner", "contact": "9865321201", "email": "neha.bansal@example.com", "members": 4, "vehicle": "MH12AB9988"},
+	{"flat_no": "D-204", "name": "Sunil Pawar", "role": "Owner", "contact": "9856012345", "email": "sunil.pawar@example.com", "members": 3, "vehicle": "MH12CD3421"},
+]
+
+# Maintenance info
+MAINTENANCE = {
+	'standard_amount': '₹3,000 / flat / quarter',
+	'due_date': '5th of the starting month of each quarter',
+	'late_fee': '₹100/week after due date',
+	'accepted_modes': ['UPI', 'Bank Transfer', 'Cash', 'Cheque'],
+	'contact': 'Society Treasurer – Priya Patil (9865321478)'
+}
+
+# Gym information and members
+GYM = {
+	'gym_name': 'SmartFit Club – GreenView Society',
+	'location': 'Clubhouse – 1st Floor, Block B',
+	'timings': '6:00 AM – 10:00 AM, 5:00 PM – 9:00 PM',
+	'trainer_name': 'Mr. Rohan Deshmukh',
+	'trainer_contact': '9876543215',
+	'trainer_availability': 'Morning (6 AM–10 AM), Evening (6 PM–9 PM)',
+	'members_enrolled': '85 Active Members',
+	'membership_fee': '₹500 / month or ₹1,200 / quarter',
+	'equipment': 'Treadmills (4), Cross Trainers (2), Dumbbells (2–30kg), Leg Press, Bench Press, Yoga Mats, Cycling Machines (3)',
+	'facilities': 'Locker Room, Water Dispenser, Changing Room, CCTV Security',
+	'rules': [
+		'Proper gym attire required',
+		'Carry towel & water bottle',
+		'Equipment to be wiped after use',
+		'No loud music',
+		'Entry restricted to members only',
+	],
+	'emergency_contact': 'Society Security Desk – 9999988888',
+	'maintenance_day': 'Every Monday (Morning – Closed for cleaning)',
+}
+
+GYM_MEMBERS = [
+	{"id": "GYM001", "name": "Sneha Kulkarni", "flat": "C-102", "type": "Quarterly", "start": "2025-10-01", "end": "2025-12-31", "mode": "UPI", "fee": 1200, "status": "Active"},
+	{"id": "GYM002", "name": "Rajesh Nair", "flat": "A-101", "type": "Monthly", "start": "2025-11-01", "end": "2025-11-30", "mode": "Cash", "fee": 500, "status": "Active"},
+	{"id": "GYM003", "name": "Rohit Sharma", "flat": "D-401", "type": "Monthly", "start": "2025-10-10", "end": "2025-11-09", "mode": "UPI", "fee": 500, "status": "Expiring Soon"},
+	{"id": "GYM004", "name": "Priya Patil", "flat": "A-202", "type": "Quarterly", "start": "2025-09-01", "end": "2025-11-30", "mode": "Bank Transfer", "fee": 1200, "status": "Active"},
+	{"id": "GYM005", "name": "Deepak Jadhav", "flat": "E-303", "type": "Monthly", "start": "2025-11-01", "end": "2025-11-30", "mode": "UPI", "fee": 500, "status": "Active"},
+]
+
+# Flat sales listings (sample data)
+FLATS_FOR_SALE = [
+	{"flat_no": "A-105", "price": "₹12,50,000", "area": "950 sqft", "contact": "9876543210", "status": "Available"},
+	{"flat_no": "B-204", "price": "₹15,00,000", "area": "1100 sqft", "contact": "9812345678", "status": "Under Negotiation"},
+	{"flat_no": "C-301", "price": "₹10,75,000", "area": "820 sqft", "contact": "9823456712", "status": "Available"},
+	{"flat_no": "D-402", "price": "₹18,20,000", "area": "1300 sqft", "contact": "9856743210", "status": "Reserved"},
+]
+
+# Static dummy defaults for the water tank percent fields and flushing option
+WATER_TANK_DEFAULTS = {
+	'filter_default': 70,
+	'hot_default': 40,
+	'regular_default': 60,
+	'flushing_default': 'ok',
+}
+
+# Demo facility records shown on the facility detail pages
+ELECTRICITY_RECORDS = [
+	{"flat_no": "A-101", "block": "A", "owner": "Rohan Deshmukh", "units": 245, "meter": "MTR-001", "month": "Oct-2025", "prev": 1820, "curr": 2065, "bill": "1,470", "status": "Paid", "payment_date": "2025-11-02", "connection_type": "Residential"},
+	{"flat_no": "A-102", "block": "A", "owner": "Sneha Patil", "units": 310, "meter": "MTR-002", "month": "Oct-2025", "prev": 2340, "curr": 2650, "bill": "1,860", "status": "Pending", "payment_date": "—", "connection_type": "Residential"},
+	{"flat_no": "A-103", "block": "A", "owner": "Amit Joshi", "units": 185, "meter": "MTR-003", "month": "Oct-2025", "prev": 950, "curr": 1135, "bill": "1,110", "status": "Paid", "payment_date": "2025-11-04", "connection_type": "Residential"},
+	{"flat_no": "B-201", "block": "B", "owner": "Priya Mehta", "units": 480, "meter": "MTR-004", "month": "Oct-2025", "prev": 4210, "curr": 4690, "bill": "2,640", "status": "Paid", "payment_date": "2025-11-03", "connection_type": "Residential"},
+	{"flat_no": "B-202", "block": "B", "owner": "Ankit Sharma", "units": 120, "meter": "MTR-005", "month": "Oct-2025", "prev": 1200, "curr": 1320, "bill": "720", "status": "Pending", "payment_date": "—", "connection_type": "Residential"},
+	{"flat_no": "C-301", "block": "C", "owner": "Neha Kulkarni", "units": 520, "meter": "MTR-006", "month": "Oct-2025", "prev": 5100, "curr": 5620, "bill": "2,880", "status": "Paid", "payment_date": "2025-11-05", "connection_type": "Residential"},
+	{"flat_no": "C-302", "block": "C", "owner": "Rajesh Singh", "units": 670, "meter": "MTR-007", "month": "Oct-2025", "prev": 3050, "curr": 3720, "bill": "3,690", "status": "Pending", "payment_date": "—", "connection_type": "Residential"},
+	{"flat_no": "C-303", "block": "C", "owner": "Aparna Nair", "units": 95, "meter": "MTR-008", "month": "Oct-2025", "prev": 880, "curr": 975, "bill": "570", "status": "Paid", "payment_date": "2025-11-01", "connection_type": "Residential"},
+	{"flat_no": "Shop-1", "block": "D", "owner": "Kiran Traders", "units": 910, "meter": "MTR-009", "month": "Oct-2025", "prev": 11000, "curr": 11910, "bill": "5,460", "status": "Paid", "payment_date": "2025-11-03", "connection_type": "Commercial"},
+	{"flat_no": "Shop-2", "block": "D", "owner": "Green Café", "units": 1050, "meter": "MTR-010", "month": "Oct-2025", "prev": 5200, "curr": 6250, "bill": "6,300", "status": "Pending", "payment_date": "—", "connection_type": "Commercial"},
+]
+
+GAS_RECORDS = [
+	{"flat_no": "A-101", "block": "A", "owner": "Rohan Deshmukh", "elec_units": 245, "elec_bill": "1,470", "gas_units": 22, "gas_bill": 660, "total": "2,130", "month": "Oct-2025", "status": "Paid", "payment_date": "2025-11-02", "meter": "MTR-001", "gas_id": "GAS-001"},
+	{"flat_no": "A-102", "block": "A", "owner": "Sneha Patil", "elec_units": 310, "elec_bill": "1,860", "gas_units": 28, "gas_bill": 840, "total": "2,700", "month": "Oct-2025", "status": "Pending", "payment_date": "—", "meter": "MTR-002", "gas_id": "GAS-002"},
+	{"flat_no": "A-103", "block": "A", "owner": "Amit Joshi", "elec_units": 185, "elec_bill": "1,110", "gas_units": 17, "gas_bill": 510, "total": "1,620", "month": "Oct-2025", "status": "Paid", "payment_date": "2025-11-04", "meter": "MTR-003", "gas_id": "GAS-003"},
+	{"flat_no": "B-201", "block": "B", "owner": "Priya Mehta", "elec_units": 480, "elec_bill": "2,640", "gas_units": 34, "gas_bill": 1020, "total": "3,660", "month": "Oct-2025", "status": "Paid", "payment_date": "2025-11-03", "meter": "MTR-004", "gas_id": "GAS-004"},
+	{"flat_no": "B-202", "block": "B", "owner": "Ankit Sharma", "elec_units": 120, "elec_bill": "720", "gas_units": 12, "gas_bill": 360, "total": "1,080", "month": "Oct-2025", "status": "Pending", "payment_date": "—", "meter": "MTR-005", "gas_id": "GAS-005"},
+	{"flat_no": "C-301", "block": "C", "owner": "Neha Kulkarni", "elec_units": 520, "elec_bill": "2,880", "gas_units": 36, "gas_bill": 1080, "total": "3,960", "month": "Oct-2025", "status": "Paid", "payment_date": "2025-11-05", "meter": "MTR-006", "gas_id": "GAS-006"},
+	{"flat_no": "C-302", "block": "C", "owner": "Rajesh Singh", "elec_units": 670, "elec_bill": "3,690", "gas_units": 42, "gas_bill": 1260, "total": "4,950", "month": "Oct-2025", "status": "Pending", "payment_date": "—", "meter": "MTR-007", "gas_id": "GAS-007"},
+	{"flat_no": "C-303", "block": "C", "owner": "Aparna Nair", "elec_units": 95, "elec_bill": "570", "gas_units": 10, "gas_bill": 300, "total": "870", "month": "Oct-2025", "status": "Paid", "payment_date": "2025-11-01", "meter": "MTR-008", "gas_id": "GAS-008"},
+	{"flat_no": "Shop-1", "block": "D", "owner": "Kiran Traders", "elec_units": 910, "elec_bill": "5,460", "gas_units": 50, "gas_bill": 1500, "total": "6,960", "month": "Oct-2025", "status": "Paid", "payment_date": "2025-11-03", "meter": "MTR-009", "gas_id": "GAS-009"},
+	{"flat_no": "Shop-2", "block": "D", "owner": "Green Café", "elec_units": 1050, "elec_bill": "6,300", "gas_units": 58, "gas_bill": 1740, "total": "8,040", "month": "Oct-2025", "status": "Pending", "payment_date": "—", "meter": "MTR-010", "gas_id": "GAS-010"},
+]
+
+WIFI_RECORDS = [
+	{"flat_no": "A-101", "block": "A", "owner": "Rohan Deshmukh", "plan": "Silver Plan", "speed": 100, "used_gb": 220, "limit_gb": 250, "bill": "799", "status": "Paid", "payment_date": "2025-11-02", "provider": "Airtel Fiber", "router": "WIFI-001", "month": "Oct-2025"},
+	{"flat_no": "A-102", "block": "A", "owner": "Sneha Patil", "plan": "Gold Plan", "speed": 200, "used_gb": 340, "limit_gb": 500, "bill": "999", "status": "Pending", "payment_date": "—", "provider": "JioFiber", "router": "WIFI-002", "month": "Oct-2025"},
+	{"flat_no": "A-103", "block": "A", "owner": "Amit Joshi", "plan": "Basic Plan", "speed": 50, "used_gb": 130, "limit_gb": 150, "bill": "499", "status": "Paid", "payment_date": "2025-11-03", "provider": "ACT Broadband", "router": "WIFI-003", "month": "Oct-2025"},
+	{"flat_no": "B-201", "block": "B", "owner": "Priya Mehta", "plan": "Premium Plan", "speed": 300, "used_gb": 460, "limit_gb": 600, "bill": "1,299", "status": "Paid", "payment_date": "2025-11-05", "provider": "Airtel Fiber", "router": "WIFI-004", "month": "Oct-2025"},
+	{"flat_no": "B-202", "block": "B", "owner": "Ankit Sharma", "plan": "Basic Plan", "speed": 50, "used_gb": 120, "limit_gb": 150, "bill": "499", "status": "Pending", "payment_date": "—", "provider": "Hathway", "router": "WIFI-005", "month": "Oct-2025"},
+	{"flat_no": "C-301", "block": "C", "owner": "Neha Kulkarni", "plan": "Silver Plan", "speed": 100, "used_gb": 240, "limit_gb": 250, "bill": "799", "status": "Paid", "payment_date": "2025-11-04", "provider": "JioFiber", "router": "WIFI-006", "month": "Oct-2025"},
+	{"flat_no": "C-302", "block": "C", "owner": "Rajesh Singh", "plan": "Gold Plan", "speed": 200, "used_gb": 410, "limit_gb": 500, "bill": "999", "status": "Pending", "payment_date": "—", "provider": "ACT Broadband", "router": "WIFI-007", "month": "Oct-2025"},
+	{"flat_no": "C-303", "block": "C", "owner": "Aparna Nair", "plan": "Basic Plan", "speed": 50, "used_gb": 100, "limit_gb": 150, "bill": "499", "status": "Paid", "payment_date": "2025-11-01", "provider": "Airtel Fiber", "router": "WIFI-008", "month": "Oct-2025"},
+	{"flat_no": "Shop-1", "block": "D", "owner": "Kiran Traders", "plan": "Business Pro", "speed": 500, "used_gb": 700, "limit_gb": 1000, "bill": "1,999", "status": "Paid", "payment_date": "2025-11-03", "provider": "Tata Play Fiber", "router": "WIFI-009", "month": "Oct-2025"},
+	{"flat_no": "Shop-2", "block": "D", "owner": "Green Café", "plan": "Business Pro", "speed": 500, "used_gb": 850, "limit_gb": 1000, "bill": "1,999", "status": "Pending", "payment_date": "—", "provider": "ACT Broadband", "router": "WIFI-010", "month": "Oct-2025"},
+]
+
+PLUMBING_RECORDS = [
+	{"flat_no": "A-101", "block": "A", "owner": "Rohan Deshmukh", "issue": "Leaky tap", "reported": "2025-11-01", "status": "Resolved", "assigned_to": "Plumber-1"},
+	{"flat_no": "B-201", "block": "B", "owner": "Priya Mehta", "issue": "Clogged drain", "reported": "2025-11-03", "status": "In Progress", "assigned_to": "Plumber-2"},
+	{"flat_no": "C-301", "block": "C", "owner": "Neha Kulkarni", "issue": "Low pressure", "reported": "2025-10-29", "status": "Scheduled", "assigned_to": "Plumber-3"},
+]
+
+SEWAGE_RECORDS = [
+	{"plant": "STP-1", "status": "Working", "last_maintenance": "2025-10-15", "ph_level": 7.2, "effluent_quality": "Pass", "remarks": "Normal"},
+	{"plant": "STP-2", "status": "Under Maintenance", "last_maintenance": "2025-09-30", "ph_level": 6.9, "effluent_quality": "Monitoring", "remarks": "Aeration issue"},
+]
@@ -0,0 +1,116 @@
+"""Maintenance ticket dispatcher.
+
+Open tickets are taken in priority order, oldest first, and given to the
+active technician for that facility with the fewest tickets in hand.
+
+Claims are compare-and-set UPDATEs (`... WHERE status = 'open'`), so two
+dispatchers running at once can never assign the same ticket, and a
+technician's slot is reserved the same way so nobody goes over capacity.
+
+Each assignment reads and then writes inside one transaction. On SQLite a
+deferred transaction cannot upgrade its read lock while another writer is
+active and fails at once with "database is locked", so settings.py opens
+SQLite transactions as IMMEDIATE: concurrent dispatchers then queue on the
+busy timeout instead of erroring.
+"""
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+
+from .models import MaintenanceTicket, Technician
+
+# How many queue heads to try when another dispatcher wins the race
+CLAIM_ATTEMPTS = 10
+
+
+def ticket_queue(facility):
+	"""Open tickets for `facility` in dispatch order (uses `ticket_queue_idx`)."""
+	return MaintenanceTicket.objects.filter(
+		facility=facility, status=MaintenanceTicket.STATUS_OPEN,
+	).order_by('priority', 'reported_at')
+
+
+def claim(pk, technician):
+	"""Assign ticket `pk` to `technician` if it is still open.
+
+	Returns False when another dispatcher claimed (or someone resolved) it
+	first. Does not touch the technician's load; callers reserve that.
+	"""
+	return bool(MaintenanceTicket.objects.filter(
+		pk=pk, status=MaintenanceTicket.STATUS_OPEN,
+	).update(
+		status=MaintenanceTicket.STATUS_ASSIGNED, assigned_to=technician, assigned_at=timezone.now(),
+	))
+
+
+def _reserve_technician(facility):
+	"""Take one slot from the least loaded technician, or return None."""
+	candidates = Technician.objects.filter(
+		facility=facility, is_active=True, active_tickets__lt=F('max_active_tickets'),
+	).order_by('active_tickets', 'pk')
+	for technician in candidates:
+		reserved = Technician.objects.filter(
+			pk=technician.pk, active_tickets__lt=F('max_active_tickets'),
+		).update(active_tickets=F('active_tickets') + 1)
+		if reserved:
+			return technician
+	return None
+
+
+def assign_next(facility):
+	"""Assign the next open ticket for `facility`; returns it or None."""
+	with transaction.atomic():
+		technician = _reserve_technician(facility)
+		if technician is None:
+			return None
+
+		for pk in ticket_queue(facility).values_list('pk', flat=True)[:CLAIM_ATTEMPTS]:
+			if claim(pk, technician):
+				return MaintenanceTicket.objects.select_related('assigned_to').get(pk=pk)
+
+		# Nothing left to claim: give the technician's slot back.
+		transaction.set_rollback(True)
+		return None
+
+
+def dispatch(facility=None):
+	"""Assign open tickets until the queue or technician capacity runs out.
+
+	Dispatches every facility unless `facility` is given. Returns the list
+	of tickets assigned in this run.
+	"""
+	facilities = [facility] if facility else [slug for slug, _ in Technician.FACILITY_CHOICES]
+	assigned = []
+	for slug in facilities:
+		while True:
+			ticket = assign_next(slug)
+			if ticket is None:
+				break
+			assigned.append(ticket)
+	return assigned
+
+
+@transaction.atomic
+def resolve(ticket):
+	"""Mark `ticket` resolved and free its technician's slot.
+
+	Returns False if the ticket was already resolved.
+	"""
+	tickets = MaintenanceTicket.objects.filter(pk=ticket.pk)
+	while True:
+		current = tickets.values('status', 'assigned_to_id').first()
+		if current is None or current['status'] == MaintenanceTicket.STATUS_RESOLVED:
+			return False
+		# Only resolve the state we just read; if a dispatcher assigned the
+		# ticket in between, go round again so the right slot is freed.
+		resolved = tickets.filter(**current).update(
+			status=MaintenanceTicket.STATUS_RESOLVED, resolved_at=timezone.now(),
+		)
+		if resolved:
+			break
+
+	if current['assigned_to_id']:
+		Technician.objects.filter(pk=current['assigned_to_id'], active_tickets__gt=0).update(
+			active_tickets=F('active_tickets') - 1,
+		)
+	return True
@@ -2,7 +2,7 @@ from django import forms
 from django.core.exceptions import ValidationError
 import re
 
-from .models import Signup
+from .models import MaintenanceTicket, Signup
 
 
 class SignupForm(forms.ModelForm):
@@ -43,4 +43,10 @@ class ProfileForm(forms.ModelForm):
         fields = ["profile_image"]
         widgets = {
             'profile_image': forms.ClearableFileInput(attrs={'accept': 'image/*'})
-        }
\ No newline at end of file
+        }
+
+
+class TicketForm(forms.ModelForm):
+    class Meta:
+        model = MaintenanceTicket
+        fields = ["flat_no", "issue", "priority"]
@@ -0,0 +1,188 @@
+"""Maintenance dues balance engine.
+
+All writes to `MaintenanceAccount` / `LedgerEntry` go through the functions
+here so each account's running balance, oldest open due date and late-fee
+watermark stay consistent with its ledger. Payments settle the oldest open
+charges first.
+"""
+from datetime import timedelta
+from decimal import ROUND_HALF_UP, Decimal
+
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from . import data
+from .models import LedgerEntry, MaintenanceAccount
+
+QUARTERLY_DUES = Decimal('3000')
+LATE_FEE_PER_WEEK = Decimal('100')
+
+PAISA = Decimal('0.01')
+# Largest amount LedgerEntry.amount (max_digits=10, decimal_places=2) can hold
+MAX_AMOUNT = Decimal('99999999.99')
+
+
+def _check_amount(amount):
+	"""Return `amount` rounded to the paisa, or raise ValueError.
+
+	Amounts are rounded before any arithmetic so open amounts and balances
+	never carry fractions the database would round away.
+	"""
+	if not amount.is_finite():
+		raise ValueError("Amount must be a number.")
+	amount = amount.quantize(PAISA, rounding=ROUND_HALF_UP)
+	if amount <= 0:
+		raise ValueError("Amount must be greater than zero.")
+	if amount > MAX_AMOUNT:
+		raise ValueError(f"Amount must not exceed {MAX_AMOUNT}.")
+	return amount
+
+
+def _locked_account(flat_no):
+	"""Lock `flat_no`'s account, opening one for flats in the directory."""
+	accounts = MaintenanceAccount.objects.select_for_update()
+	account = accounts.filter(flat_no=flat_no).first()
+	if account is None:
+		if flat_no not in {apartment['flat_no'] for apartment in data.APARTMENTS}:
+			raise ValueError(f"Unknown flat {flat_no}.")
+		account, _ = accounts.get_or_create(flat_no=flat_no)
+	return account
+
+
+def _refresh_oldest_due(account):
+	oldest = (
+		account.entries.filter(kind=LedgerEntry.KIND_CHARGE, open_amount__gt=0)
+		.order_by('due_date')
+		.values_list('due_date', flat=True)
+		.first()
+	)
+	account.oldest_due_date = oldest
+
+
+def _add_debit(account, kind, amount, due_date, description=''):
+	# Any advance already paid (negative balance) settles the new debit first.
+	credit = max(-account.balance, Decimal('0'))
+	entry = LedgerEntry.objects.create(
+		account=account,
+		kind=kind,
+		amount=amount,
+		open_amount=amount - min(credit, amount),
+		due_date=due_date,
+		description=description,
+	)
+	account.balance += amount
+	return entry
+
+
+@transaction.atomic
+def post_charge(flat_no, amount, due_date, description=''):
+	"""Charge `amount` to `flat_no`, payable by `due_date`."""
+	amount = _check_amount(amount)
+	account = _locked_account(flat_no)
+	entry = _add_debit(account, LedgerEntry.KIND_CHARGE, amount, due_date, description)
+	if entry.open_amount and (account.oldest_due_date is None or due_date < account.oldest_due_date):
+		account.oldest_due_date = due_date
+	account.save(update_fields=['balance', 'oldest_due_date', 'updated_at'])
+	return entry
+
+
+def post_quarterly_dues(due_date, amount=QUARTERLY_DUES):
+	"""Charge the quarterly maintenance to every flat; returns the new charges.
+
+	Flats come from the apartment directory plus any account already in the
+	ledger. Flats that already have a charge due on `due_date` are skipped,
+	so re-running the command for the same quarter is harmless.
+	"""
+	amount = _check_amount(amount)
+	flats = {apartment['flat_no'] for apartment in data.APARTMENTS}
+	flats.update(MaintenanceAccount.objects.values_list('flat_no', flat=True))
+	charged = set(
+		LedgerEntry.objects.filter(kind=LedgerEntry.KIND_CHARGE, due_date=due_date)
+		.values_list('account__flat_no', flat=True)
+	)
+	description = f"Maintenance for quarter due {due_date:%Y-%m-%d}"
+	return [post_charge(flat_no, amount, due_date, description) for flat_no in sorted(flats - charged)]
+
+
+@transaction.atomic
+def post_payment(flat_no, amount, mode='', description=''):
+	"""Record a payment and apply it to the oldest open charges first."""
+	amount = _check_amount(amount)
+	account = _locked_account(flat_no)
+	entry = LedgerEntry.objects.create(
+		account=account,
+		kind=LedgerEntry.KIND_PAYMENT,
+		amount=amount,
+		mode=mode,
+		description=description,
+	)
+	account.balance -= amount
+
+	remaining = amount
+	settled = []
+	for debit in account.entries.filter(open_amount__gt=0).order_by('due_date', 'id'):
+		if not remaining:
+			break
+		applied = min(remaining, debit.open_amount)
+		debit.open_amount -= applied
+		remaining -= applied
+		settled.append(debit)
+	LedgerEntry.objects.bulk_update(settled, ['open_amount'])
+
+	_refresh_oldest_due(account)
+	account.save(update_fields=['balance', 'oldest_due_date', 'updated_at'])
+	return entry
+
+
+@transaction.atomic
+def _charge_late_fee(pk, today):
+	account = MaintenanceAccount.objects.select_for_update().get(pk=pk)
+	# Re-check under the lock: a payment may have landed since the scan.
+	if account.oldest_due_date is None or account.oldest_due_date >= today:
+		return None
+
+	# Weeks already charged are never charged again, even if an older charge
+	# is settled and the open due date moves forward.
+	start = max(account.oldest_due_date, account.late_fee_through or account.oldest_due_date)
+	weeks = (today - start).days // 7
+	if weeks <= 0:
+		return None
+
+	entry = _add_debit(
+		account,
+		LedgerEntry.KIND_LATE_FEE,
+		LATE_FEE_PER_WEEK * weeks,
+		today,
+		f"Late fee: {weeks} week(s) from {start:%Y-%m-%d}",
+	)
+	account.late_fee_through = start + timedelta(weeks=weeks)
+	account.save(update_fields=['balance', 'late_fee_through', 'updated_at'])
+	return entry
+
+
+def apply_late_fees(today=None):
+	"""Charge late fees accrued up to `today`; returns the new late-fee entries.
+
+	Only accounts owing at least one new full week are visited: the oldest
+	open charge and the `late_fee_through` watermark must both be a week or
+	more in the past. Each is charged just the weeks since the watermark, so
+	the daily run costs the same however long the ledger history grows.
+	"""
+	today = today or timezone.localdate()
+	cutoff = today - timedelta(weeks=1)
+	overdue = MaintenanceAccount.objects.filter(
+		Q(late_fee_through__isnull=True) | Q(late_fee_through__lte=cutoff),
+		oldest_due_date__lte=cutoff,
+	).values_list('pk', flat=True)
+	entries = []
+	for pk in list(overdue):
+		entry = _charge_late_fee(pk, today)
+		if entry:
+			entries.append(entry)
+	return entries
+
+
+def outstanding_dues():
+	"""Accounts that owe money, largest balance first (one indexed query)."""
+	return MaintenanceAccount.objects.filter(balance__gt=0).order_by('-balance')
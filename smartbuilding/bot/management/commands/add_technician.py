@@ -0,0 +1,30 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from bot.models import Technician
+
+
+class Command(BaseCommand):
+	help = "Add a technician who can be assigned maintenance tickets."
+
+	def add_arguments(self, parser):
+		parser.add_argument('name', help="Technician's name.")
+		parser.add_argument(
+			'--facility', required=True, choices=[slug for slug, _ in Technician.FACILITY_CHOICES],
+			help="Facility the technician handles.",
+		)
+		parser.add_argument('--contact-number', default='', help="Phone number.")
+		parser.add_argument(
+			'--max-active-tickets', type=int, default=5,
+			help="Tickets the technician can hold at once (default: 5).",
+		)
+
+	def handle(self, *args, **options):
+		if options['max_active_tickets'] < 1:
+			raise CommandError("--max-active-tickets must be at least 1.")
+		technician = Technician.objects.create(
+			name=options['name'],
+			facility=options['facility'],
+			contact_number=options['contact_number'],
+			max_active_tickets=options['max_active_tickets'],
+		)
+		self.stdout.write(self.style.SUCCESS(f"Added technician #{technician.pk} {technician.name} for {technician.get_facility_display()}."))
@@ -0,0 +1,28 @@
+from datetime import date
+
+from django.core.management.base import BaseCommand, CommandError
+
+from bot import ledger
+
+
+class Command(BaseCommand):
+	help = "Charge weekly maintenance late fees to overdue flats. Run once a day."
+
+	def add_arguments(self, parser):
+		parser.add_argument(
+			'--date',
+			help="Compute fees as of this date (YYYY-MM-DD) instead of today.",
+		)
+
+	def handle(self, *args, **options):
+		today = None
+		if options['date']:
+			try:
+				today = date.fromisoformat(options['date'])
+			except ValueError:
+				raise CommandError("--date must be in YYYY-MM-DD format.")
+
+		entries = ledger.apply_late_fees(today)
+		for entry in entries:
+			self.stdout.write(f"{entry.account.flat_no}: ₹{entry.amount} ({entry.description})")
+		self.stdout.write(self.style.SUCCESS(f"Charged late fees to {len(entries)} flat(s)."))
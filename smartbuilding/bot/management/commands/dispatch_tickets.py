@@ -0,0 +1,24 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from bot import dispatch
+from bot.models import Technician
+
+
+class Command(BaseCommand):
+	help = "Assign open maintenance tickets to technicians by priority, age and current load."
+
+	def add_arguments(self, parser):
+		parser.add_argument(
+			'--facility',
+			help="Only dispatch tickets for this facility slug (e.g. plumbing).",
+		)
+
+	def handle(self, *args, **options):
+		facility = options['facility']
+		if facility and facility not in dict(Technician.FACILITY_CHOICES):
+			raise CommandError(f"Unknown facility '{facility}'.")
+
+		tickets = dispatch.dispatch(facility)
+		for ticket in tickets:
+			self.stdout.write(f"#{ticket.pk} {ticket.flat_no} {ticket.issue} -> {ticket.assigned_to}")
+		self.stdout.write(self.style.SUCCESS(f"Assigned {len(tickets)} ticket(s)."))
@@ -0,0 +1,71 @@
+from datetime import timedelta
+
+from django.apps import apps
+from django.core.management.base import BaseCommand
+from django.db import models
+from django.utils import timezone
+
+from bot.storage import ContentAddressedStorage
+
+
+class Command(BaseCommand):
+	help = "Delete content-addressed media blobs that no model row references any more."
+
+	def add_arguments(self, parser):
+		parser.add_argument(
+			'--dry-run', action='store_true',
+			help="List the blobs that would be deleted without deleting them.",
+		)
+		parser.add_argument(
+			'--min-age', type=float, default=24,
+			help="Only delete blobs older than this many hours, so uploads whose row "
+			"has not been saved yet are left alone (default: 24).",
+		)
+
+	def handle(self, *args, **options):
+		cutoff = timezone.now() - timedelta(hours=options['min_age'])
+		deleted = kept = 0
+
+		for storage, referenced in self._referenced_by_storage().items():
+			if not storage.exists(''):
+				continue
+			for name in self._walk(storage, ''):
+				if not storage.is_blob(name) or name in referenced:
+					kept += 1
+					continue
+				if storage.get_modified_time(name) > cutoff:
+					kept += 1
+					continue
+				if options['dry_run']:
+					self.stdout.write(f"Would delete {name}")
+				else:
+					storage.delete_blob(name)
+					self.stdout.write(f"Deleted {name}")
+				deleted += 1
+
+		verb = "Would delete" if options['dry_run'] else "Deleted"
+		self.stdout.write(self.style.SUCCESS(f"{verb} {deleted} blob(s), kept {kept} file(s)."))
+
+	def _referenced_by_storage(self):
+		"""Map each content-addressed storage to the set of names rows point at."""
+		referenced = {}
+		for model in apps.get_models():
+			for field in model._meta.concrete_fields:
+				if not isinstance(field, models.FileField):
+					continue
+				if not isinstance(field.storage, ContentAddressedStorage):
+					continue
+				names = (
+					model._default_manager.exclude(**{f'{field.attname}__isnull': True})
+					.exclude(**{field.attname: ''})
+					.values_list(field.attname, flat=True)
+				)
+				referenced.setdefault(field.storage, set()).update(names.iterator())
+		return referenced
+
+	def _walk(self, storage, path):
+		directories, files = storage.listdir(path)
+		for filename in files:
+			yield f"{path}/{filename}" if path else filename
+		for directory in directories:
+			yield from self._walk(storage, f"{path}/{directory}" if path else directory)
@@ -0,0 +1,37 @@
+from datetime import date
+from decimal import Decimal, InvalidOperation
+
+from django.core.management.base import BaseCommand, CommandError
+
+from bot import ledger
+
+
+class Command(BaseCommand):
+	help = "Charge the quarterly maintenance dues to every flat."
+
+	def add_arguments(self, parser):
+		parser.add_argument(
+			'--due-date', required=True,
+			help="Date the dues are payable by (YYYY-MM-DD).",
+		)
+		parser.add_argument(
+			'--amount', default=str(ledger.QUARTERLY_DUES),
+			help=f"Amount per flat (default: {ledger.QUARTERLY_DUES}).",
+		)
+
+	def handle(self, *args, **options):
+		try:
+			due_date = date.fromisoformat(options['due_date'])
+		except ValueError:
+			raise CommandError("--due-date must be in YYYY-MM-DD format.")
+		try:
+			amount = Decimal(options['amount'])
+		except InvalidOperation:
+			raise CommandError("--amount must be a number greater than zero.")
+		try:
+			entries = ledger.post_quarterly_dues(due_date, amount)
+		except ValueError as exc:
+			raise CommandError(f"--amount: {exc}")
+
+		charged = entries[0].amount if entries else amount
+		self.stdout.write(self.style.SUCCESS(f"Charged ₹{charged} to {len(entries)} flat(s), due {due_date}."))
@@ -0,0 +1,62 @@
+import os
+import subprocess
+import sys
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+# Boot the app the way a WSGI server does, in a fresh interpreter so nothing
+# is already imported. Importing wsgi.py also runs the warm-up.
+BOOT_SCRIPT = "import smartbuilding.wsgi"
+
+
+def parse_importtime(output):
+	"""Parse `python -X importtime` output into (module, self_us, cumulative_us)."""
+	rows = []
+	for line in output.splitlines():
+		if not line.startswith('import time:'):
+			continue
+		self_us, cumulative_us, module = line[len('import time:'):].split('|', 2)
+		if not self_us.strip().isdigit():
+			continue  # header line
+		rows.append((module.strip(), int(self_us), int(cumulative_us)))
+	return rows
+
+
+class Command(BaseCommand):
+	help = "Report per-module import cost of booting the WSGI application."
+
+	def add_arguments(self, parser):
+		parser.add_argument(
+			'--limit', type=int, default=25,
+			help="Number of modules to show (default: 25).",
+		)
+		parser.add_argument(
+			'--sort', choices=['self', 'cumulative'], default='cumulative',
+			help="Rank by the module's own import time or including its imports.",
+		)
+		parser.add_argument(
+			'--prefix', default='',
+			help="Only show modules whose name starts with this, e.g. 'bot'.",
+		)
+
+	def handle(self, *args, **options):
+		env = dict(os.environ, DJANGO_SETTINGS_MODULE=os.environ.get('DJANGO_SETTINGS_MODULE', 'smartbuilding.settings'))
+		result = subprocess.run(
+			[sys.executable, '-X', 'importtime', '-c', BOOT_SCRIPT],
+			cwd=settings.BASE_DIR, env=env, capture_output=True, text=True,
+		)
+		if result.returncode:
+			raise CommandError(f"Booting the application failed:\n{result.stderr}")
+
+		rows = parse_importtime(result.stderr)
+		total_us = sum(self_us for _, self_us, _ in rows)
+		module_count = len(rows)
+		column = 1 if options['sort'] == 'self' else 2
+		rows = [row for row in rows if row[0].startswith(options['prefix'])]
+		rows.sort(key=lambda row: row[column], reverse=True)
+
+		self.stdout.write(f"{'self ms':>9} {'cumul ms':>9}  module")
+		for module, self_us, cumulative_us in rows[:options['limit']]:
+			self.stdout.write(f"{self_us / 1000:9.1f} {cumulative_us / 1000:9.1f}  {module}")
+		self.stdout.write(self.style.SUCCESS(f"Total import time: {total_us / 1000:.1f} ms across {module_count} module(s)."))
@@ -0,0 +1,32 @@
+from decimal import Decimal, InvalidOperation
+
+from django.core.management.base import BaseCommand, CommandError
+
+from bot import data, ledger
+from bot.models import MaintenanceAccount
+
+
+class Command(BaseCommand):
+	help = "Record a maintenance payment from a flat."
+
+	def add_arguments(self, parser):
+		parser.add_argument('flat_no', help="Flat number, e.g. A-101.")
+		parser.add_argument('amount', help="Amount paid in rupees.")
+		parser.add_argument(
+			'--mode', default='', choices=data.MAINTENANCE['accepted_modes'],
+			help="Payment mode.",
+		)
+		parser.add_argument('--description', default='', help="Reference or note, e.g. a UPI transaction id.")
+
+	def handle(self, *args, **options):
+		try:
+			amount = Decimal(options['amount'])
+		except InvalidOperation:
+			raise CommandError("Amount must be a number greater than zero.")
+		try:
+			entry = ledger.post_payment(options['flat_no'], amount, options['mode'], options['description'])
+		except ValueError as exc:
+			raise CommandError(exc)
+
+		account = MaintenanceAccount.objects.get(pk=entry.account_id)
+		self.stdout.write(self.style.SUCCESS(f"Recorded ₹{entry.amount} from {account.flat_no}; balance is now ₹{account.balance}."))
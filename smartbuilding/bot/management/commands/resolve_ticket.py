@@ -0,0 +1,21 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from bot import dispatch
+from bot.models import MaintenanceTicket
+
+
+class Command(BaseCommand):
+	help = "Mark a maintenance ticket resolved and free its technician's slot."
+
+	def add_arguments(self, parser):
+		parser.add_argument('ticket_id', type=int, help="Ticket number, e.g. 42.")
+
+	def handle(self, *args, **options):
+		try:
+			ticket = MaintenanceTicket.objects.select_related('assigned_to').get(pk=options['ticket_id'])
+		except MaintenanceTicket.DoesNotExist:
+			raise CommandError(f"Ticket #{options['ticket_id']} does not exist.")
+
+		if not dispatch.resolve(ticket):
+			raise CommandError(f"Ticket #{ticket.pk} is already resolved.")
+		self.stdout.write(self.style.SUCCESS(f"Resolved ticket #{ticket.pk} ({ticket.issue})."))
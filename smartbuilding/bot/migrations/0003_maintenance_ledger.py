@@ -0,0 +1,45 @@
+# Generated by Django 5.2.8 on 2026-10-19 02:38
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('bot', '0002_signup_profile_image'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MaintenanceAccount',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('flat_no', models.CharField(max_length=20, unique=True)),
+                ('balance', models.DecimalField(decimal_places=2, default=0, max_digits=10)),
+                ('oldest_due_date', models.DateField(blank=True, null=True)),
+                ('late_fee_through', models.DateField(blank=True, null=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'indexes': [models.Index(condition=models.Q(('balance__gt', 0)), fields=['-balance'], name='dues_outstanding_idx'), models.Index(condition=models.Q(('oldest_due_date__isnull', False)), fields=['oldest_due_date'], name='dues_open_idx')],
+            },
+        ),
+        migrations.CreateModel(
+            name='LedgerEntry',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('charge', 'Charge'), ('late_fee', 'Late fee'), ('payment', 'Payment')], max_length=20)),
+                ('amount', models.DecimalField(decimal_places=2, max_digits=10)),
+                ('open_amount', models.DecimalField(decimal_places=2, default=0, max_digits=10)),
+                ('due_date', models.DateField(blank=True, null=True)),
+                ('mode', models.CharField(blank=True, max_length=30)),
+                ('description', models.CharField(blank=True, max_length=200)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('account', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='entries', to='bot.maintenanceaccount')),
+            ],
+            options={
+                'indexes': [models.Index(condition=models.Q(('open_amount__gt', 0)), fields=['account', 'due_date'], name='ledger_open_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,44 @@
+# Generated by Django 5.2.8 on 2026-10-19 02:39
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('bot', '0003_maintenance_ledger'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Technician',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=150)),
+                ('contact_number', models.CharField(blank=True, max_length=15)),
+                ('facility', models.CharField(choices=[('water-tank', 'Water tank'), ('electricity', 'Electricity'), ('gas-line', 'Gas line'), ('wifi', 'WiFi'), ('plumbing', 'Plumbing'), ('sewage-treatment', 'Sewage treatment')], max_length=30)),
+                ('is_active', models.BooleanField(default=True)),
+                ('active_tickets', models.PositiveIntegerField(default=0)),
+                ('max_active_tickets', models.PositiveIntegerField(default=5)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='MaintenanceTicket',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('flat_no', models.CharField(max_length=20)),
+                ('facility', models.CharField(choices=[('water-tank', 'Water tank'), ('electricity', 'Electricity'), ('gas-line', 'Gas line'), ('wifi', 'WiFi'), ('plumbing', 'Plumbing'), ('sewage-treatment', 'Sewage treatment')], max_length=30)),
+                ('issue', models.CharField(max_length=200)),
+                ('priority', models.PositiveSmallIntegerField(choices=[(1, 'Urgent'), (2, 'High'), (3, 'Normal'), (4, 'Low')], default=3)),
+                ('status', models.CharField(choices=[('open', 'Open'), ('assigned', 'Assigned'), ('resolved', 'Resolved')], default='open', max_length=20)),
+                ('reported_at', models.DateTimeField(auto_now_add=True)),
+                ('assigned_at', models.DateTimeField(blank=True, null=True)),
+                ('resolved_at', models.DateTimeField(blank=True, null=True)),
+                ('assigned_to', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='tickets', to='bot.technician')),
+            ],
+            options={
+                'indexes': [models.Index(condition=models.Q(('status', 'open')), fields=['facility', 'priority', 'reported_at'], name='ticket_queue_idx'), models.Index(condition=models.Q(('status', 'resolved'), _negated=True), fields=['facility', 'reported_at'], name='ticket_active_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.8 on 2026-10-19 02:49
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('bot', '0004_maintenance_tickets'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='maintenanceticket',
+            name='facility',
+            field=models.CharField(choices=[('water-tank', 'Water tank capacity'), ('electricity', 'Electricity'), ('gas-line', 'Gas line'), ('wifi', 'WiFi'), ('plumbing', 'Plumbing'), ('sewage-treatment', 'Sewage treatment')], max_length=30),
+        ),
+        migrations.AlterField(
+            model_name='technician',
+            name='facility',
+            field=models.CharField(choices=[('water-tank', 'Water tank capacity'), ('electricity', 'Electricity'), ('gas-line', 'Gas line'), ('wifi', 'WiFi'), ('plumbing', 'Plumbing'), ('sewage-treatment', 'Sewage treatment')], max_length=30),
+        ),
+    ]
@@ -1,6 +1,8 @@
 from django.db import models
 from django.contrib.auth.hashers import make_password
 
+from . import data
+
 
 class Signup(models.Model):
 	ROLE_SECURITY = 'security'
@@ -30,3 +32,128 @@ class Signup(models.Model):
 
 	def __str__(self):
 		return f"{self.full_name} ({self.get_role_display()})"
+
+
+class MaintenanceAccount(models.Model):
+	"""Running maintenance balance for one flat.
+
+	Kept up to date by `bot.ledger` whenever an entry is posted, so reports
+	and the late-fee job never have to sum the ledger history.
+	"""
+
+	flat_no = models.CharField(max_length=20, unique=True)
+	# Positive means the flat owes money, negative is an advance/credit
+	balance = models.DecimalField(max_digits=10, decimal_places=2, default=0)
+	# Due date of the oldest maintenance charge that is not fully paid
+	oldest_due_date = models.DateField(null=True, blank=True)
+	# Late fees have been charged for every full week up to this date
+	late_fee_through = models.DateField(null=True, blank=True)
+	updated_at = models.DateTimeField(auto_now=True)
+
+	class Meta:
+		indexes = [
+			models.Index(fields=['-balance'], condition=models.Q(balance__gt=0), name='dues_outstanding_idx'),
+			models.Index(fields=['oldest_due_date'], condition=models.Q(oldest_due_date__isnull=False), name='dues_open_idx'),
+		]
+
+	def __str__(self):
+		return f"{self.flat_no} (₹{self.balance})"
+
+
+class LedgerEntry(models.Model):
+	KIND_CHARGE = 'charge'
+	KIND_LATE_FEE = 'late_fee'
+	KIND_PAYMENT = 'payment'
+
+	KIND_CHOICES = [
+		(KIND_CHARGE, 'Charge'),
+		(KIND_LATE_FEE, 'Late fee'),
+		(KIND_PAYMENT, 'Payment'),
+	]
+
+	account = models.ForeignKey(MaintenanceAccount, on_delete=models.CASCADE, related_name='entries')
+	kind = models.CharField(max_length=20, choices=KIND_CHOICES)
+	amount = models.DecimalField(max_digits=10, decimal_places=2)
+	# Unpaid part of a charge or late fee; always 0 for payments
+	open_amount = models.DecimalField(max_digits=10, decimal_places=2, default=0)
+	due_date = models.DateField(null=True, blank=True)
+	mode = models.CharField(max_length=30, blank=True)
+	description = models.CharField(max_length=200, blank=True)
+	created_at = models.DateTimeField(auto_now_add=True)
+
+	class Meta:
+		indexes = [
+			models.Index(fields=['account', 'due_date'], condition=models.Q(open_amount__gt=0), name='ledger_open_idx'),
+		]
+
+	def __str__(self):
+		return f"{self.account.flat_no} {self.get_kind_display()} ₹{self.amount}"
+
+
+class Technician(models.Model):
+	# Same slugs and names as the dashboard and API facility pages
+	FACILITY_CHOICES = list(data.FACILITY_NAMES.items())
+
+	name = models.CharField(max_length=150)
+	contact_number = models.CharField(max_length=15, blank=True)
+	facility = models.CharField(max_length=30, choices=FACILITY_CHOICES)
+	is_active = models.BooleanField(default=True)
+	# Tickets currently assigned and not yet resolved; kept by `bot.dispatch`
+	active_tickets = models.PositiveIntegerField(default=0)
+	max_active_tickets = models.PositiveIntegerField(default=5)
+
+	def __str__(self):
+		return self.name
+
+
+class MaintenanceTicket(models.Model):
+	PRIORITY_URGENT = 1
+	PRIORITY_HIGH = 2
+	PRIORITY_NORMAL = 3
+	PRIORITY_LOW = 4
+
+	PRIORITY_CHOICES = [
+		(PRIORITY_URGENT, 'Urgent'),
+		(PRIORITY_HIGH, 'High'),
+		(PRIORITY_NORMAL, 'Normal'),
+		(PRIORITY_LOW, 'Low'),
+	]
+
+	STATUS_OPEN = 'open'
+	STATUS_ASSIGNED = 'assigned'
+	STATUS_RESOLVED = 'resolved'
+
+	STATUS_CHOICES = [
+		(STATUS_OPEN, 'Open'),
+		(STATUS_ASSIGNED, 'Assigned'),
+		(STATUS_RESOLVED, 'Resolved'),
+	]
+
+	flat_no = models.CharField(max_length=20)
+	facility = models.CharField(max_length=30, choices=Technician.FACILITY_CHOICES)
+	issue = models.CharField(max_length=200)
+	priority = models.PositiveSmallIntegerField(choices=PRIORITY_CHOICES, default=PRIORITY_NORMAL)
+	status = models.CharField(max_length=20, choices=STATUS_CHOICES, default=STATUS_OPEN)
+	assigned_to = models.ForeignKey(Technician, on_delete=models.SET_NULL, null=True, blank=True, related_name='tickets')
+	reported_at = models.DateTimeField(auto_now_add=True)
+	assigned_at = models.DateTimeField(null=True, blank=True)
+	resolved_at = models.DateTimeField(null=True, blank=True)
+
+	class Meta:
+		indexes = [
+			# Queue order for the dispatcher. Only open tickets are indexed, so
+			# the index stays small however much resolved history piles up.
+			models.Index(
+				fields=['facility', 'priority', 'reported_at'],
+				condition=models.Q(status='open'),
+				name='ticket_queue_idx',
+			),
+			models.Index(
+				fields=['facility', 'reported_at'],
+				condition=~models.Q(status='resolved'),
+				name='ticket_active_idx',
+			),
+		]
+
+	def __str__(self):
+		return f"{self.flat_no}: {self.issue} ({self.get_status_display()})"
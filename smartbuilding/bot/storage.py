@@ -0,0 +1,63 @@
+"""Content-addressed storage for uploaded media.
+
+Uploads are stored under the SHA-256 of their bytes instead of the name the
+browser sent, e.g. ``profiles/Screenshot_2025-11-06_115949.png`` becomes
+``profiles/3f/3fa4...e1.png``. Uploading the same image twice therefore
+reuses the existing file rather than writing a ``_abc123`` suffixed copy.
+
+Because one blob can back several rows, files are never removed when a row
+changes; run ``python manage.py gc_media`` to delete unreferenced blobs.
+"""
+import hashlib
+import os
+import re
+
+from django.core.files.storage import FileSystemStorage
+
+# <upload_to>/<first two hex digits>/<full sha256><ext>
+BLOB_NAME_RE = re.compile(r'(?:^|/)([0-9a-f]{2})/(\1[0-9a-f]{62})(\.[A-Za-z0-9]+)?$')
+
+
+def content_hash(content):
+	"""Return the hex SHA-256 of `content`, read in chunks to bound memory."""
+	digest = hashlib.sha256()
+	for chunk in content.chunks():
+		digest.update(chunk)
+	return digest.hexdigest()
+
+
+class ContentAddressedStorage(FileSystemStorage):
+	"""File system storage that names and deduplicates files by content hash."""
+
+	def blob_name(self, name, digest):
+		"""Return the storage name for a file originally called `name`."""
+		directory, filename = os.path.split(name)
+		ext = os.path.splitext(filename)[1].lower()
+		return os.path.join(directory, digest[:2], digest + ext).replace('\\', '/')
+
+	def is_blob(self, name):
+		return bool(BLOB_NAME_RE.search(name))
+
+	def _save(self, name, content):
+		name = self.blob_name(name, content_hash(content))
+		if self.exists(name):
+			# Same bytes are already stored: point the field at that blob.
+			# Touch it so `gc_media --min-age` treats it as a fresh upload.
+			os.utime(self.path(name))
+			return name
+		saved = super()._save(name, content)
+		if saved != name:
+			# An identical upload created the blob after our exists() check and
+			# FileSystemStorage fell back to a suffixed name; drop our copy.
+			super().delete(saved)
+			os.utime(self.path(name))
+		return name
+
+	def delete_blob(self, name):
+		"""Delete a blob and its shard directory once that is empty."""
+		self.delete(name)
+		shard = os.path.dirname(self.path(name))
+		try:
+			os.rmdir(shard)
+		except OSError:
+			pass  # other blobs still live there
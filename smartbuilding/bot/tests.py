@@ -1,3 +1,475 @@
-from django.test import TestCase
+import datetime
+from decimal import Decimal
+import gzip
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from io import StringIO
+from unittest import mock
 
-# Create your tests here.
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.core.management import CommandError, call_command
+from django.test import SimpleTestCase, TestCase, override_settings
+
+from . import api, data, dispatch, ledger
+from .models import LedgerEntry, MaintenanceAccount, MaintenanceTicket, Signup, Technician
+from .storage import ContentAddressedStorage
+from .warmup import warm_up
+
+
+def make_user(**kwargs):
+	fields = {
+		'role': Signup.ROLE_FLAT_OWNER,
+		'full_name': 'Test Resident',
+		'contact_number': '9876543210',
+		'aadhar_number': '123412341234',
+		'dob': datetime.date(1990, 1, 1),
+		'password': 'secret123',
+	}
+	fields.update(kwargs)
+	return Signup.objects.create(**fields)
+
+# Seconds a fresh process may take from interpreter start to the first
+# /login/ response. Override with COLD_START_BUDGET on slow CI runners.
+COLD_START_BUDGET = float(os.environ.get('COLD_START_BUDGET', '3.0'))
+
+# Boot the WSGI app like a waking dyno and serve a single GET /login/.
+FIRST_REQUEST_SCRIPT = """
+import sys
+from wsgiref.util import setup_testing_defaults
+
+from smartbuilding.wsgi import application
+
+environ = {'PATH_INFO': '/login/'}
+setup_testing_defaults(environ)
+statuses = []
+b''.join(application(environ, lambda status, headers: statuses.append(status)))
+sys.stdout.write(statuses[0])
+"""
+
+
+class WarmUpTests(SimpleTestCase):
+	bot_templates = len(os.listdir(os.path.join(os.path.dirname(__file__), 'templates')))
+
+	def test_compiles_only_project_templates(self):
+		# Admin and other installed apps' templates are not compiled at boot
+		self.assertEqual(warm_up(), self.bot_templates)
+
+	def test_broken_template_does_not_abort_boot(self):
+		extra = tempfile.mkdtemp()
+		self.addCleanup(shutil.rmtree, extra)
+		with open(os.path.join(extra, 'broken.html'), 'w') as f:
+			f.write('{% if %}')
+		with open(os.path.join(extra, 'fine.html'), 'w') as f:
+			f.write('ok')
+		templates = [dict(settings.TEMPLATES[0], DIRS=[extra])]
+		with override_settings(TEMPLATES=templates), self.assertLogs('bot.warmup', 'ERROR'):
+			self.assertEqual(warm_up(), self.bot_templates + 1)
+
+
+class ColdStartTests(SimpleTestCase):
+	def test_first_login_response_within_budget(self):
+		env = dict(os.environ, DJANGO_SETTINGS_MODULE='smartbuilding.settings')
+		started = time.perf_counter()
+		result = subprocess.run(
+			[sys.executable, '-c', FIRST_REQUEST_SCRIPT],
+			cwd=settings.BASE_DIR, env=env, capture_output=True, text=True,
+		)
+		elapsed = time.perf_counter() - started
+
+		self.assertEqual(result.returncode, 0, result.stderr)
+		self.assertEqual(result.stdout, '200 OK')
+		self.assertLess(
+			elapsed, COLD_START_BUDGET,
+			f"Cold start to first /login/ response took {elapsed:.2f}s "
+			f"(budget {COLD_START_BUDGET:.2f}s). Run `manage.py profile_imports` to see what got slower.",
+		)
+
+
+class ApiTests(TestCase):
+	def setUp(self):
+		self.user = make_user()
+		session = self.client.session
+		session['user_id'] = self.user.id
+		session.save()
+
+	def test_requires_login(self):
+		self.client.logout()
+		response = self.client.get('/api/v1/directory/')
+		self.assertEqual(response.status_code, 401)
+		self.assertEqual(response.content, b'{"error":"Authentication required."}')
+
+	def test_deleted_account_loses_access(self):
+		self.user.delete()
+		self.assertEqual(self.client.get('/api/v1/directory/').status_code, 401)
+
+	def test_account_check_expires(self):
+		self.assertEqual(self.client.get('/api/v1/directory/').status_code, 200)
+		self.user.delete()
+		with mock.patch('bot.api.time.time', return_value=time.time() + api.ACCOUNT_CHECK_TTL):
+			self.assertEqual(self.client.get('/api/v1/directory/').status_code, 401)
+
+	def test_unknown_resource_is_json_404(self):
+		response = self.client.get('/api/v1/nope/')
+		self.assertEqual(response.status_code, 404)
+		self.assertEqual(response.json(), {'error': 'Not found.'})
+		self.assertEqual(self.client.get('/api/v1/facilities/nope/').status_code, 404)
+
+	def test_field_selection(self):
+		response = self.client.get('/api/v1/directory/?fields=flat_no,name&limit=1')
+		self.assertEqual(response.json()['results'], [{'flat_no': 'A-101', 'name': 'Rajesh Nair'}])
+
+	def test_field_validation(self):
+		response = self.client.get('/api/v1/gym/?fields=nope')
+		self.assertEqual(response.status_code, 400)
+		self.assertEqual(response.json(), {'error': 'Unknown fields: nope.'})
+		self.assertEqual(self.client.get('/api/v1/gym/?fields=,').status_code, 400)
+		self.assertEqual(self.client.get('/api/v1/gym/?limit=0').status_code, 400)
+
+	def test_keyset_pagination_with_string_keys(self):
+		first = self.client.get('/api/v1/directory/?fields=flat_no&limit=3').json()
+		self.assertEqual([r['flat_no'] for r in first['results']], ['A-101', 'A-104', 'A-202'])
+		self.assertEqual(first['next'], 'A-202')
+		second = self.client.get('/api/v1/directory/?fields=flat_no&limit=3&after=A-202').json()
+		self.assertEqual([r['flat_no'] for r in second['results']], ['A-303', 'B-201', 'B-303'])
+
+	def test_keyset_pagination_with_int_keys(self):
+		# "10" sorts before "9" as a string; cursors must compare as ints
+		page = self.client.get('/api/v1/events/?fields=id&limit=2&after=9').json()
+		self.assertEqual(page, {'results': [{'id': 10}, {'id': 11}], 'next': None})
+		self.assertEqual(self.client.get('/api/v1/events/?after=x').status_code, 400)
+
+	def test_bad_cursor_is_400_before_revalidation(self):
+		response = self.client.get('/api/v1/events/?after=x', HTTP_IF_NONE_MATCH='*')
+		self.assertEqual(response.status_code, 400)
+		self.assertEqual(response.json(), {'error': 'Invalid `after` cursor.'})
+
+	def test_revalidation_returns_304(self):
+		response = self.client.get('/api/v1/parking/')
+		etag = response['ETag']
+		self.assertFalse(etag.startswith('W/'))
+		with self.assertNumQueries(0):  # cached session, account checked recently
+			revalidated = self.client.get('/api/v1/parking/', HTTP_IF_NONE_MATCH=etag)
+		self.assertEqual(revalidated.status_code, 304)
+		self.assertEqual(revalidated.content, b'')
+
+	def test_etag_depends_on_query(self):
+		a = self.client.get('/api/v1/directory/?limit=1')['ETag']
+		b = self.client.get('/api/v1/directory/?limit=2')['ETag']
+		self.assertNotEqual(a, b)
+
+	def test_gzip_has_its_own_etag(self):
+		plain = self.client.get('/api/v1/directory/')
+		zipped = self.client.get('/api/v1/directory/', HTTP_ACCEPT_ENCODING='gzip')
+		self.assertEqual(zipped['Content-Encoding'], 'gzip')
+		self.assertIn('Accept-Encoding', zipped['Vary'])
+		self.assertEqual(gzip.decompress(zipped.content), plain.content)
+		self.assertNotEqual(plain['ETag'], zipped['ETag'])
+		self.assertEqual(
+			self.client.get('/api/v1/directory/', HTTP_IF_NONE_MATCH=plain['ETag'],
+				HTTP_ACCEPT_ENCODING='gzip').status_code,
+			200,
+		)
+
+
+class TempMediaMixin:
+	def setUp(self):
+		super().setUp()
+		self.media_root = tempfile.mkdtemp()
+		self.addCleanup(shutil.rmtree, self.media_root)
+		self.storage = ContentAddressedStorage(location=self.media_root)
+
+
+class ContentAddressedStorageTests(TempMediaMixin, SimpleTestCase):
+	def test_names_files_by_content_hash(self):
+		name = self.storage.save('profiles/Screenshot 1.PNG', ContentFile(b'image'))
+		self.assertRegex(name, r'^profiles/([0-9a-f]{2})/\1[0-9a-f]{62}\.png$')
+		self.assertTrue(self.storage.is_blob(name))
+
+	def test_identical_uploads_share_one_file(self):
+		first = self.storage.save('profiles/a.png', ContentFile(b'same'))
+		second = self.storage.save('profiles/b.png', ContentFile(b'same'))
+		other = self.storage.save('profiles/c.png', ContentFile(b'different'))
+		self.assertEqual(first, second)
+		self.assertNotEqual(first, other)
+		self.assertEqual(len(self.storage.listdir(os.path.dirname(first))[1]), 1)
+
+	def test_dedup_hit_refreshes_mtime(self):
+		name = self.storage.save('profiles/a.png', ContentFile(b'same'))
+		os.utime(self.storage.path(name), (0, 0))
+		self.storage.save('profiles/b.png', ContentFile(b'same'))
+		self.assertGreater(os.path.getmtime(self.storage.path(name)), 0)
+
+	def test_concurrent_identical_upload_keeps_hash_name(self):
+		name = self.storage.save('profiles/a.png', ContentFile(b'same'))
+		# Simulate losing the race: our exists() check misses the blob, which
+		# another upload writes before we do.
+		real_exists = self.storage.exists
+		missed = []
+
+		def exists(path):
+			if path == name and not missed:
+				missed.append(path)
+				return False
+			return real_exists(path)
+
+		with mock.patch.object(self.storage, 'exists', side_effect=exists):
+			second = self.storage.save('profiles/b.png', ContentFile(b'same'))
+		self.assertEqual(missed, [name])
+		self.assertEqual(second, name)
+		self.assertEqual(self.storage.listdir(os.path.dirname(name))[1], [os.path.basename(name)])
+
+
+class GcMediaTests(TempMediaMixin, TestCase):
+	def setUp(self):
+		super().setUp()
+		override = override_settings(MEDIA_ROOT=self.media_root)
+		override.enable()
+		self.addCleanup(override.disable)
+
+	def gc(self, *args):
+		out = StringIO()
+		call_command('gc_media', *args, stdout=out)
+		return out.getvalue()
+
+	def test_deletes_only_unreferenced_blobs(self):
+		user = make_user()
+		user.profile_image.save('kept.png', ContentFile(b'kept'))
+		orphan = self.storage.save('profiles/orphan.png', ContentFile(b'orphan'))
+		legacy = self.storage.path('profiles/Screenshot.png')
+		with open(legacy, 'wb') as f:
+			f.write(b'legacy upload')
+
+		self.gc('--min-age', '0', '--dry-run')
+		self.assertTrue(self.storage.exists(orphan))
+
+		output = self.gc('--min-age', '0')
+		self.assertIn(f"Deleted {orphan}", output)
+		self.assertFalse(self.storage.exists(orphan))
+		# Empty shard directories go too
+		self.assertFalse(os.path.exists(os.path.dirname(self.storage.path(orphan))))
+		self.assertTrue(self.storage.exists(user.profile_image.name))
+		self.assertTrue(os.path.exists(legacy))
+
+	def test_recent_blobs_are_kept(self):
+		orphan = self.storage.save('profiles/orphan.png', ContentFile(b'orphan'))
+		self.gc()
+		self.assertTrue(self.storage.exists(orphan))
+
+
+class LedgerTests(TestCase):
+	def account(self, flat_no='A-101'):
+		return MaintenanceAccount.objects.get(flat_no=flat_no)
+
+	def test_payment_settles_oldest_charge_first(self):
+		q1 = ledger.post_charge('A-101', Decimal('3000'), datetime.date(2025, 1, 5))
+		q2 = ledger.post_charge('A-101', Decimal('3000'), datetime.date(2025, 4, 5))
+		ledger.post_payment('A-101', Decimal('4000'))
+		q1.refresh_from_db()
+		q2.refresh_from_db()
+		self.assertEqual(q1.open_amount, 0)
+		self.assertEqual(q2.open_amount, Decimal('2000'))
+		account = self.account()
+		self.assertEqual(account.balance, Decimal('2000'))
+		self.assertEqual(account.oldest_due_date, datetime.date(2025, 4, 5))
+
+	def test_credit_settles_new_debit(self):
+		ledger.post_payment('A-101', Decimal('3500'))
+		charge = ledger.post_charge('A-101', Decimal('3000'), datetime.date(2025, 1, 5))
+		self.assertEqual(charge.open_amount, 0)
+		self.assertIsNone(self.account().oldest_due_date)
+		partly = ledger.post_charge('A-101', Decimal('3000'), datetime.date(2025, 4, 5))
+		self.assertEqual(partly.open_amount, Decimal('2500'))
+		self.assertEqual(self.account().balance, Decimal('2500'))
+
+	def test_rejects_non_positive_amounts(self):
+		for amount in (Decimal('0'), Decimal('-100')):
+			with self.assertRaises(ValueError):
+				ledger.post_charge('A-101', amount, datetime.date(2025, 1, 5))
+			with self.assertRaises(ValueError):
+				ledger.post_payment('A-101', amount)
+		self.assertFalse(LedgerEntry.objects.exists())
+
+	def test_amounts_are_rounded_to_the_paisa(self):
+		ledger.post_charge('A-101', Decimal('3000'), datetime.date(2025, 1, 5))
+		payment = ledger.post_payment('A-101', Decimal('2999.995'))
+		self.assertEqual(payment.amount, Decimal('3000.00'))
+		account = self.account()
+		self.assertEqual(account.balance, 0)
+		self.assertIsNone(account.oldest_due_date)
+		self.assertFalse(LedgerEntry.objects.filter(open_amount__gt=0).exists())
+		self.assertEqual(ledger.apply_late_fees(datetime.date(2025, 3, 1)), [])
+
+	def test_rejects_amounts_too_large_to_store(self):
+		with self.assertRaises(ValueError):
+			ledger.post_payment('A-101', Decimal('1e12'))
+		with self.assertRaises(ValueError):
+			ledger.post_charge('A-101', Decimal('Infinity'), datetime.date(2025, 1, 5))
+		self.assertFalse(LedgerEntry.objects.exists())
+
+	def test_rejects_unknown_flats(self):
+		with self.assertRaises(ValueError):
+			ledger.post_payment('A-1O1', Decimal('3000'))
+		self.assertFalse(MaintenanceAccount.objects.exists())
+
+	def test_late_fee_counts_full_weeks_only(self):
+		ledger.post_charge('A-101', Decimal('3000'), datetime.date(2025, 1, 5))
+		self.assertEqual(ledger.apply_late_fees(datetime.date(2025, 1, 11)), [])
+		[fee] = ledger.apply_late_fees(datetime.date(2025, 1, 20))
+		self.assertEqual(fee.amount, Decimal('200'))
+		self.assertEqual(self.account().late_fee_through, datetime.date(2025, 1, 19))
+		# Day 20 and 25 fall inside the third week: nothing new to charge
+		self.assertEqual(ledger.apply_late_fees(datetime.date(2025, 1, 25)), [])
+		[fee] = ledger.apply_late_fees(datetime.date(2025, 1, 26))
+		self.assertEqual(fee.amount, Decimal('100'))
+		self.assertEqual(self.account().balance, Decimal('3300'))
+
+	def test_weeks_are_not_charged_twice_when_due_date_moves(self):
+		ledger.post_charge('A-101', Decimal('3000'), datetime.date(2025, 1, 5))
+		ledger.post_charge('A-101', Decimal('3000'), datetime.date(2025, 1, 12))
+		ledger.apply_late_fees(datetime.date(2025, 2, 2))  # 4 weeks from Jan 5
+		ledger.post_payment('A-101', Decimal('3000'))  # Q1 paid, Jan 12 is now oldest
+		self.assertEqual(self.account().oldest_due_date, datetime.date(2025, 1, 12))
+		self.assertEqual(ledger.apply_late_fees(datetime.date(2025, 2, 8)), [])
+		[fee] = ledger.apply_late_fees(datetime.date(2025, 2, 9))
+		self.assertEqual(fee.amount, Decimal('100'))
+
+	def test_late_fee_scan_skips_accounts_without_a_new_week(self):
+		ledger.post_charge('A-101', Decimal('3000'), datetime.date(2025, 1, 5))
+		ledger.post_charge('B-201', Decimal('3000'), datetime.date(2025, 1, 15))
+		ledger.apply_late_fees(datetime.date(2025, 1, 12))
+		# A-101 is watermarked to Jan 12 and B-201 is under a week overdue, so
+		# the scan finds nothing to lock.
+		with self.assertNumQueries(1):
+			self.assertEqual(ledger.apply_late_fees(datetime.date(2025, 1, 18)), [])
+
+	def test_outstanding_dues_report(self):
+		ledger.post_charge('A-101', Decimal('3000'), datetime.date(2025, 1, 5))
+		ledger.post_charge('B-201', Decimal('6000'), datetime.date(2025, 1, 5))
+		ledger.post_charge('A-104', Decimal('3000'), datetime.date(2025, 1, 5))
+		ledger.post_payment('A-104', Decimal('3000'))
+		with self.assertNumQueries(1):
+			report = [(a.flat_no, a.balance) for a in ledger.outstanding_dues()]
+		self.assertEqual(report, [('B-201', Decimal('6000')), ('A-101', Decimal('3000'))])
+
+	def test_post_quarterly_dues_is_idempotent(self):
+		out = StringIO()
+		call_command('post_quarterly_dues', '--due-date', '2025-01-05', stdout=out)
+		flats = MaintenanceAccount.objects.count()
+		self.assertEqual(flats, len(data.APARTMENTS))
+		self.assertEqual(self.account().balance, ledger.QUARTERLY_DUES)
+		call_command('post_quarterly_dues', '--due-date', '2025-01-05', stdout=out)
+		self.assertEqual(LedgerEntry.objects.count(), flats)
+
+	def test_record_payment_command(self):
+		ledger.post_charge('A-101', Decimal('3000'), datetime.date(2025, 1, 5))
+		call_command('record_payment', 'A-101', '1000', '--mode', 'UPI', stdout=StringIO())
+		self.assertEqual(self.account().balance, Decimal('2000'))
+		for flat_no, amount in (('A-101', '-5'), ('A-101', 'five'), ('A-101', '1e12'), ('Z-999', '100')):
+			with self.assertRaises(CommandError):
+				call_command('record_payment', flat_no, amount, stdout=StringIO())
+		self.assertEqual(LedgerEntry.objects.count(), 2)
+		with self.assertRaises(CommandError):
+			call_command('post_quarterly_dues', '--due-date', '2025-04-05', '--amount', '1e12', stdout=StringIO())
+
+
+class DispatchTests(TestCase):
+	def setUp(self):
+		self.plumber = Technician.objects.create(name='Plumber-1', facility='plumbing', max_active_tickets=2)
+
+	def ticket(self, priority=MaintenanceTicket.PRIORITY_NORMAL, facility='plumbing'):
+		return MaintenanceTicket.objects.create(flat_no='A-101', facility=facility, issue='Leak', priority=priority)
+
+	def test_facility_choices_match_dashboard(self):
+		self.assertEqual(dict(Technician.FACILITY_CHOICES), data.FACILITY_NAMES)
+
+	def test_assigns_by_priority_then_age(self):
+		low = self.ticket(MaintenanceTicket.PRIORITY_LOW)
+		old = self.ticket()
+		urgent = self.ticket(MaintenanceTicket.PRIORITY_URGENT)
+		assigned = dispatch.dispatch('plumbing')
+		self.assertEqual([t.pk for t in assigned], [urgent.pk, old.pk])
+		low.refresh_from_db()
+		self.assertEqual(low.status, MaintenanceTicket.STATUS_OPEN)
+
+	def test_prefers_least_loaded_technician(self):
+		other = Technician.objects.create(name='Plumber-2', facility='plumbing', max_active_tickets=2)
+		self.ticket()
+		self.ticket()
+		assigned = dispatch.dispatch('plumbing')
+		self.assertEqual({t.assigned_to_id for t in assigned}, {self.plumber.pk, other.pk})
+
+	def test_claimed_ticket_cannot_be_claimed_again(self):
+		pk = self.ticket().pk
+		other = Technician.objects.create(name='Plumber-2', facility='plumbing')
+		self.assertTrue(dispatch.claim(pk, self.plumber))
+		self.assertFalse(dispatch.claim(pk, other))
+		self.assertEqual(MaintenanceTicket.objects.get(pk=pk).assigned_to, self.plumber)
+
+	def test_technician_never_exceeds_capacity(self):
+		for _ in range(4):
+			self.ticket()
+		self.assertEqual(len(dispatch.dispatch('plumbing')), 2)
+		self.assertIsNone(dispatch.assign_next('plumbing'))
+		self.plumber.refresh_from_db()
+		self.assertEqual(self.plumber.active_tickets, 2)
+		self.assertEqual(MaintenanceTicket.objects.filter(status=MaintenanceTicket.STATUS_OPEN).count(), 2)
+
+	def test_no_slot_reserved_when_queue_is_empty(self):
+		self.assertIsNone(dispatch.assign_next('plumbing'))
+		self.plumber.refresh_from_db()
+		self.assertEqual(self.plumber.active_tickets, 0)
+
+	def test_resolve_twice_frees_one_slot(self):
+		self.ticket()
+		self.ticket()
+		first, second = dispatch.dispatch('plumbing')
+		self.assertTrue(dispatch.resolve(first))
+		self.assertFalse(dispatch.resolve(first))
+		self.plumber.refresh_from_db()
+		self.assertEqual(self.plumber.active_tickets, 1)
+
+	def test_resolved_slot_is_reused(self):
+		for _ in range(3):
+			self.ticket()
+		first, _ = dispatch.dispatch('plumbing')
+		call_command('resolve_ticket', str(first.pk), stdout=StringIO())
+		self.assertEqual(len(dispatch.dispatch('plumbing')), 1)
+		with self.assertRaises(CommandError):
+			call_command('resolve_ticket', str(first.pk), stdout=StringIO())
+
+	def test_report_ticket_from_facility_page(self):
+		url = '/dashboard/facilities/plumbing/tickets/'
+		form = {'flat_no': 'B-201', 'issue': 'Clogged drain', 'priority': MaintenanceTicket.PRIORITY_HIGH}
+		self.assertRedirects(self.client.post(url, form), '/login/')
+		self.assertFalse(MaintenanceTicket.objects.exists())
+
+		session = self.client.session
+		session['user_id'] = make_user().id
+		session.save()
+		response = self.client.post(url, form)
+		self.assertRedirects(response, '/dashboard/facilities/plumbing/')
+		ticket = MaintenanceTicket.objects.get()
+		self.assertEqual((ticket.facility, ticket.status), ('plumbing', MaintenanceTicket.STATUS_OPEN))
+		self.assertContains(self.client.get('/dashboard/facilities/plumbing/'), 'Clogged drain')
+
+	def test_report_ticket_needs_an_existing_account(self):
+		user = make_user()
+		session = self.client.session
+		session['user_id'] = user.id
+		session.save()
+		user.delete()
+		form = {'flat_no': 'B-201', 'issue': 'Clogged drain', 'priority': MaintenanceTicket.PRIORITY_HIGH}
+		self.assertRedirects(self.client.post('/dashboard/facilities/plumbing/tickets/', form), '/login/')
+		self.assertFalse(MaintenanceTicket.objects.exists())
+
+	def test_add_technician_command(self):
+		call_command('add_technician', 'Electrician-1', '--facility', 'electricity', stdout=StringIO())
+		electrician = Technician.objects.get(facility='electricity')
+		self.assertEqual((electrician.name, electrician.max_active_tickets), ('Electrician-1', 5))
+		with self.assertRaises(CommandError):
+			call_command('add_technician', 'Nobody', '--facility', 'plumbing', '--max-active-tickets', '0', stdout=StringIO())
@@ -0,0 +1,64 @@
+"""Start-up warm-up for sleeping dynos.
+
+Django builds the URL resolver, imports the views and compiles templates
+lazily, so after a Heroku/Render dyno wakes up the first visitor pays for
+all of it. `warm_up()` does that work at boot instead; `wsgi.py` and
+`asgi.py` call it once the application object exists.
+"""
+import logging
+import os
+import time
+from pathlib import Path
+
+from django.apps import apps
+from django.template import TemplateSyntaxError, engines
+from django.template.backends.django import DjangoTemplates
+from django.urls import get_resolver, reverse
+
+logger = logging.getLogger(__name__)
+
+
+# Apps whose templates are compiled at boot. Django's and third-party
+# templates are left to compile lazily.
+WARMUP_APPS = ['bot']
+
+
+def _project_templates(backend):
+	"""Yield template names from TEMPLATES['DIRS'] and the WARMUP_APPS."""
+	directories = [Path(directory) for directory in backend.engine.dirs]
+	directories += [Path(apps.get_app_config(label).path) / 'templates' for label in WARMUP_APPS]
+	for directory in directories:
+		for root, _, files in os.walk(directory):
+			for filename in files:
+				if filename.endswith('.html'):
+					yield (Path(root) / filename).relative_to(directory).as_posix()
+
+
+def warm_up():
+	"""Populate the URL resolver and the cached template loader.
+
+	Returns the number of templates compiled.
+	"""
+	started = time.perf_counter()
+
+	# Building the resolver imports every view module; reversing a name
+	# fills the reverse lookup tables too.
+	get_resolver().url_patterns
+	reverse('login')
+
+	# The cached loader keeps compiled templates for the life of the process.
+	compiled = 0
+	for backend in engines.all():
+		if not isinstance(backend, DjangoTemplates):
+			continue
+		for name in _project_templates(backend):
+			try:
+				backend.get_template(name)
+			except TemplateSyntaxError:
+				# A broken template should fail its own page, not the boot.
+				logger.exception("Warm-up could not compile template %s", name)
+				continue
+			compiled += 1
+
+	logger.info("Warm-up compiled %d templates in %.0f ms", compiled, (time.perf_counter() - started) * 1000)
+	return compiled
@@ -14,3 +14,8 @@ from django.core.asgi import get_asgi_application
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'smartbuilding.settings')
 
 application = get_asgi_application()
+
+# Resolve URLs and compile templates now rather than on the first request
+from bot.warmup import warm_up  # noqa: E402
+
+warm_up()
@@ -86,6 +86,12 @@ DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
         'NAME': BASE_DIR / 'db.sqlite3',
+        # Take the write lock when a transaction starts. Read-then-write
+        # transactions (ledger postings, ticket dispatch) otherwise fail with
+        # "database is locked" instead of waiting when two run at once.
+        'OPTIONS': {
+            'transaction_mode': 'IMMEDIATE',
+        },
     }
 }
 
@@ -141,3 +147,18 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 # Media files (user uploads)
 MEDIA_URL = '/media/'
 MEDIA_ROOT = BASE_DIR / 'media'
+
+# Uploads are stored by content hash so identical images share one file.
+# Run `python manage.py gc_media` to remove blobs no longer referenced.
+STORAGES = {
+    'default': {
+        'BACKEND': 'bot.storage.ContentAddressedStorage',
+    },
+    'staticfiles': {
+        'BACKEND': 'django.contrib.staticfiles.storage.StaticFilesStorage',
+    },
+}
+
+# Sessions are written through to the database and read from the cache, so
+# API revalidations (304s) are answered without a query.
+SESSION_ENGINE = 'django.contrib.sessions.backends.cached_db'
@@ -19,6 +19,7 @@ from django.urls import path
 from django.views.generic import RedirectView
 
 # import views from the bot app
+from bot import api as bot_api
 from bot import views as bot_views
 
 urlpatterns = [
@@ -29,6 +30,10 @@ urlpatterns = [
     path('dashboard/', bot_views.dashboard, name='dashboard'),
     path('dashboard/<slug:page>/', bot_views.dashboard_page, name='dashboard_page'),
     path('dashboard/facilities/<slug:facility>/', bot_views.facility_detail, name='facility_detail'),
+    path('dashboard/facilities/<slug:facility>/tickets/', bot_views.report_ticket, name='report_ticket'),
+    # Read-only JSON API for the mobile client
+    path('api/v1/facilities/<slug:facility>/', bot_api.facility_view, name='api_facility'),
+    path('api/v1/<slug:resource>/', bot_api.resource_view, name='api_resource'),
 ]
 
 # Serve media files during development
@@ -14,3 +14,8 @@ from django.core.wsgi import get_wsgi_application
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'smartbuilding.settings')
 
 application = get_wsgi_application()
+
+# Resolve URLs and compile templates now rather than on the first request
+from bot.warmup import warm_up  # noqa: E402
+
+warm_up()